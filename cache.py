@@ -0,0 +1,91 @@
+# cache.py
+import dbm
+import functools
+import os
+import shelve
+import threading
+import time
+from collections import OrderedDict
+
+# Lives next to the generated reports so it is easy to find and delete
+CACHE_DIR = os.path.join(os.getcwd(), "reports", ".cache")
+
+
+class DiskCache:
+    """A small shelve-backed store whose entries expire after a TTL."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: float):
+        """Returns the cached value, or None if it is missing or older than ttl seconds."""
+        try:
+            with self._lock, self._open() as db:
+                entry = db.get(key)
+        except (OSError, dbm.error):
+            return None
+        if entry is None:
+            return None
+        stored_at, value = entry
+        return value if time.time() - stored_at < ttl else None
+
+    def set(self, key: str, value):
+        try:
+            with self._lock, self._open() as db:
+                db[key] = (time.time(), value)
+        except (OSError, dbm.error):
+            pass  # A cache we can't write to just means the next scan pays full price
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        return shelve.open(self.path)
+
+
+class MemoryCache:
+    """An in-process LRU store with the same get/set interface as DiskCache."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: float):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.time() - stored_at >= ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value):
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+def ttl_cached(cache, ttl: float):
+    """Caches a Scanner method's result for ttl seconds.
+
+    The key is the method name plus its arguments, or the scanner's target
+    domain when the method takes none. Results containing an "error" key are
+    not stored, so failed lookups are retried on the next scan.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args):
+            key = "|".join((method.__name__, *(map(str, args) if args else [self.target_domain])))
+            value = cache.get(key, ttl)
+            if value is None:
+                value = method(self, *args)
+                if "error" not in value:
+                    cache.set(key, value)
+            return value
+        return wrapper
+    return decorator
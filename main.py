@@ -1,7 +1,9 @@
 # main.py
 import os
 import time
+import itertools
 import threading
+from collections import deque
 import tkinter as tk
 from tkinter import ttk, messagebox
 
@@ -15,6 +17,14 @@ from reporting import build_pdf_report
 APP_NAME = "Automated Recon Tool"
 REPORTS_DIR = os.path.join(os.getcwd(), "reports")
 
+# Rows inserted per idle tick when filling the results tree
+TREE_INSERT_BATCH = 200
+# Dummy child that gives collapsed nodes an expander until they are opened
+TREE_PLACEHOLDER = "Loading…"
+# Alternating row tags, indexed by row_count & 1
+_EVEN = ('evenrow',)
+_ODD = ('oddrow',)
+
 # --- Define a more professional look and feel ---
 COLORS = {
     "background": "#2D2D2D",
@@ -52,6 +62,10 @@ class ReconApp(ThemedTk):
         os.makedirs(REPORTS_DIR, exist_ok=True)
         self.last_scan_result = None
         self.last_scan_target = None
+        self._insert_queue = deque()
+        self._iid_counter = itertools.count()
+        self._drain_job = None
+        self._data_by_iid = {}
 
         self._configure_styles()
         self._create_widgets()
@@ -122,6 +136,7 @@ class ReconApp(ThemedTk):
 
         self.tree.tag_configure('oddrow', background=COLORS["tree_odd"])
         self.tree.tag_configure('evenrow', background=COLORS["tree_even"])
+        self.tree.bind('<<TreeviewOpen>>', self._on_open)
 
         vsb = ttk.Scrollbar(result_frame, orient="vertical", command=self.tree.yview)
         hsb = ttk.Scrollbar(result_frame, orient="horizontal", command=self.tree.xview)
@@ -159,17 +174,21 @@ class ReconApp(ThemedTk):
         total_modules = 9 
         self.modules_done = 0
 
+        # Modules now report from several worker threads at once, so the
+        # counter is only ever touched on the Tk thread.
         def progress_callback(status_text: str):
             self.after(0, self._update_status, status_text)
             if "Done" in status_text or "Error" in status_text:
-                self.modules_done += 1
-                progress_value = (self.modules_done / total_modules) * 100
-                self.after(0, self._update_progress_bar, progress_value)
+                self.after(0, self._on_module_finished, total_modules)
 
         scanner = Scanner(target, progress_callback)
         self.last_scan_result = scanner.run_full_scan()
         self.after(0, self._on_scan_complete)
 
+    def _on_module_finished(self, total_modules: int):
+        self.modules_done += 1
+        self._update_progress_bar((self.modules_done / total_modules) * 100)
+
     def _on_scan_complete(self):
         self._populate_treeview(self.last_scan_result)
         self._update_status(f"Scan for {self.last_scan_target} complete.")
@@ -177,35 +196,65 @@ class ReconApp(ThemedTk):
         self.export_btn.config(state=tk.NORMAL)
 
     def _populate_treeview(self, data: dict):
+        # Rows are queued here and inserted a batch at a time from idle
+        # callbacks, so large results never block the Tk event loop.
+        # Collapsed subtrees are only materialised when the user opens them.
         self.clear_results()
         self.row_count = 0 
         for module_name, results in data.items():
-            parent_node = self.tree.insert('', 'end', text=module_name, open=True, tags=('heading',))
+            parent_node = self._queue_insert('', text=module_name, open=True, tags=('heading',))
             if isinstance(results, dict):
-                for key, value in results.items():
-                    self._insert_tree_data(parent_node, key, value)
+                self._queue_children(parent_node, results.items())
             else:
-                tag = 'evenrow' if self.row_count % 2 == 0 else 'oddrow'
-                self.tree.insert(parent_node, 'end', text="Result", values=(str(results),), tags=(tag,))
-                self.row_count += 1
-    
-    def _insert_tree_data(self, parent_node, key, value):
-        tag = 'evenrow' if self.row_count % 2 == 0 else 'oddrow'
-        self.row_count += 1
+                self._queue_insert(parent_node, text="Result", values=(str(results),), tags=self._next_row_tag())
+        self._schedule_drain()
 
-        if isinstance(value, dict):
-            node = self.tree.insert(parent_node, 'end', text=key, open=False, tags=(tag,))
-            for sub_key, sub_value in value.items():
-                self._insert_tree_data(node, sub_key, sub_value)
-        elif isinstance(value, list):
-            node = self.tree.insert(parent_node, 'end', text=key, open=False, tags=(tag,))
-            if not value:
-                self.tree.item(node, values=("[Empty List]",))
+    def _queue_children(self, parent_node, items):
+        """Queues one level of rows; nested dicts/lists are stashed until opened."""
+        for key, value in items:
+            tag = self._next_row_tag()
+            if isinstance(value, list) and not value:
+                self._queue_insert(parent_node, text=key, open=False, values=("[Empty List]",), tags=tag)
+            elif isinstance(value, (dict, list)):
+                node = self._queue_insert(parent_node, text=key, open=False, tags=tag)
+                if value:
+                    self._data_by_iid[node] = value
             else:
-                for i, item in enumerate(value):
-                    self._insert_tree_data(node, f"[{i}]", item)
-        else:
-            self.tree.insert(parent_node, 'end', text=key, values=(str(value),), tags=(tag,))
+                self._queue_insert(parent_node, text=key, values=(str(value),), tags=tag)
+
+    def _on_open(self, event):
+        node = self.tree.focus()
+        value = self._data_by_iid.pop(node, None)
+        if value is None:
+            return
+        self.tree.delete(*self.tree.get_children(node))
+        items = value.items() if isinstance(value, dict) else ((f"[{i}]", item) for i, item in enumerate(value))
+        self._queue_children(node, items)
+        self._schedule_drain()
+
+    def _next_row_tag(self) -> tuple[str]:
+        tag = (_EVEN, _ODD)[self.row_count & 1]
+        self.row_count += 1
+        return tag
+
+    def _queue_insert(self, parent_node, **options) -> str:
+        # iids are assigned up front so children can be queued before their parent exists
+        iid = f"row{next(self._iid_counter)}"
+        self._insert_queue.append((parent_node, iid, options))
+        return iid
+
+    def _schedule_drain(self):
+        if self._drain_job is None and self._insert_queue:
+            self._drain_job = self.after_idle(self._drain_insert_queue)
+
+    def _drain_insert_queue(self):
+        self._drain_job = None
+        for _ in range(min(TREE_INSERT_BATCH, len(self._insert_queue))):
+            parent_node, iid, options = self._insert_queue.popleft()
+            self.tree.insert(parent_node, 'end', iid=iid, **options)
+            if iid in self._data_by_iid:
+                self.tree.insert(iid, 'end', text=TREE_PLACEHOLDER)
+        self._schedule_drain()
     
     def export_pdf(self):
         if not self.last_scan_result:
@@ -214,14 +263,31 @@ class ReconApp(ThemedTk):
         filename = f"{self.last_scan_target.replace('.', '_')}_{int(time.time())}.pdf"
         out_path = os.path.join(REPORTS_DIR, filename)
         
+        self.export_btn.config(state=tk.DISABLED)
+        self._update_status(f"Generating PDF report at {out_path}...")
+        # Target and results are passed in so a new scan can't swap them mid-build
+        thread = threading.Thread(target=self._pdf_worker,
+                                  args=(self.last_scan_target, self.last_scan_result, out_path), daemon=True)
+        thread.start()
+
+    def _pdf_worker(self, target: str, results: dict, out_path: str):
+        # Runs off the Tk thread; the result is handed back via after()
+        error = None
         try:
-            self._update_status(f"Generating PDF report at {out_path}...")
-            build_pdf_report(self.last_scan_target, self.last_scan_result, out_path)
-            messagebox.showinfo("Success", f"Report successfully saved to:\n{out_path}")
+            build_pdf_report(target, results, out_path)
         except Exception as e:
-            messagebox.showerror("PDF Export Error", f"Failed to generate report: {e}")
-        finally:
+            error = e
+        self.after(0, self._on_pdf_done, out_path, error)
+
+    def _on_pdf_done(self, out_path: str, error: Exception | None):
+        # A scan started meanwhile owns the button and status bar until it completes
+        if str(self.start_btn['state']) == tk.NORMAL:
+            self.export_btn.config(state=tk.NORMAL)
             self._update_status("Ready")
+        if error:
+            messagebox.showerror("PDF Export Error", f"Failed to generate report: {error}")
+        else:
+            messagebox.showinfo("Success", f"Report successfully saved to:\n{out_path}")
 
     def _update_status(self, text: str):
         self.status_label.config(text=text)
@@ -230,8 +296,14 @@ class ReconApp(ThemedTk):
         self.progress_bar['value'] = value
 
     def clear_results(self):
-        for i in self.tree.get_children():
-            self.tree.delete(i)
+        if self._drain_job:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
+        self._insert_queue.clear()
+        self._data_by_iid.clear()
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
 if __name__ == '__main__':
     app = ReconApp()
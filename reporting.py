@@ -1,12 +1,56 @@
 # reporting.py
-import json
 from datetime import datetime
+from xml.sax.saxutils import escape
 
+from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Preformatted, Table, TableStyle
 from reportlab.lib.units import inch
 
+# Values longer than this (or spanning lines) are printed as free-flowing blocks
+# below the table, since a single table row cannot split across pages.
+MAX_CELL_CHARS = 1000
+# Wrap width for Preformatted blocks in the Code style on an A4 page
+MAX_LINE_CHARS = 100
+
+TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.25, colors.grey),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+
+
+def _flatten(data, prefix: str = ""):
+    """Yields (dotted key, value) pairs for every leaf of nested dicts/lists."""
+    if isinstance(data, dict) and data:
+        for key, value in data.items():
+            yield from _flatten(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(data, list) and data:
+        for i, item in enumerate(data):
+            yield from _flatten(item, f"{prefix}[{i}]")
+    else:
+        yield prefix, "[]" if data == [] else "{}" if data == {} else str(data)
+
+
+def _dict_flowables(data: dict, styles) -> list:
+    """Lays a result dict out as a key/value table plus blocks for long values."""
+    cell_style = ParagraphStyle('Cell', parent=styles['Code'], leftIndent=0)
+    rows = [[Paragraph("Key", cell_style), Paragraph("Value", cell_style)]]
+    blocks = []
+    for key, value in _flatten(data):
+        if "\n" in value or len(value) > MAX_CELL_CHARS:
+            blocks.append(Paragraph(escape(key), styles['h3']))
+            blocks.append(Preformatted(value, styles['Code'], maxLineLength=MAX_LINE_CHARS))
+        else:
+            rows.append([Paragraph(escape(key), cell_style), Paragraph(escape(value), cell_style)])
+
+    flowables = []
+    if len(rows) > 1:
+        flowables.append(Table(rows, colWidths=[2 * inch, 5 * inch], repeatRows=1, style=TABLE_STYLE))
+    return flowables + blocks
+
+
 def build_pdf_report(target_domain: str, results: dict, out_path: str):
     """Generates a professional PDF report from scan results."""
     doc = SimpleDocTemplate(out_path, pagesize=A4,
@@ -28,10 +72,7 @@ def build_pdf_report(target_domain: str, results: dict, out_path: str):
         story.append(Spacer(1, 0.1 * inch))
 
         if isinstance(data, dict):
-            # Pretty print dictionary with proper formatting for PDF
-            text = json.dumps(data, indent=4, ensure_ascii=False)
-            text = text.replace('\n', '<br/>').replace(' ', '&nbsp;')
-            story.append(Paragraph(f"<pre>{text}</pre>", styles['Code']))
+            story.extend(_dict_flowables(data, styles))
         else:
             story.append(Paragraph(str(data), styles['Normal']))
 
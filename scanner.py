@@ -1,11 +1,18 @@
 # scanner.py
+import asyncio
+import functools
 import os
 import ssl
 import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from cache import CACHE_DIR, DiskCache, MemoryCache, ttl_cached
 
 # --- UPDATED --- : Added builtwith
 try:
@@ -17,26 +24,84 @@ except ImportError:
     dnsresolver = None
     builtwith = None
 
+# Optional: lets the admin panel finder multiplex probes over HTTP/2 from one event loop
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    import h2  # noqa: F401
+    HTTP2_SUPPORTED = True
+except ImportError:
+    HTTP2_SUPPORTED = False
+
+# Prefer the C-backed lxml parser; fall back to the pure-Python one if it's missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+ADMIN_PATHS_FILE = os.path.join("assets", "common_admin_paths.txt")
+
+# Number of admin paths probed in parallel (also the size of the connection pool)
+ADMIN_PROBE_WORKERS = 32
+# Connection cap for async admin probes. Over HTTP/2 they share one multiplexed
+# connection; servers that only speak HTTP/1.1 get up to this many in parallel.
+ADMIN_PROBE_CONNECTIONS = 64
+
+# WHOIS and geolocation data rarely change, so repeat scans reuse them for a day
+LOOKUP_CACHE_TTL = 24 * 60 * 60
+_lookup_cache = DiskCache(os.path.join(CACHE_DIR, "lookups"))
+# Tech stack fingerprints are kept in memory for an hour within a session
+TECH_CACHE_TTL = 60 * 60
+_tech_cache = MemoryCache(maxsize=128)
+
+
+# Repeated scans of the same host skip the parse and the resolver round trip.
+# Call _resolve.cache_clear() to force a fresh lookup.
+@functools.lru_cache(maxsize=256)
+def _normalize(target: str) -> str:
+    """Extracts a clean domain from user input (URL or domain)."""
+    if not target.startswith(('http://', 'https://')):
+        target = f"http://{target}"
+    parsed_uri = urlparse(target)
+    return parsed_uri.netloc
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve(domain: str) -> str:
+    """Resolves a domain to its primary IPv4 address."""
+    return socket.getaddrinfo(domain, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
+
 
 class Scanner:
     """A class to encapsulate all OSINT scanning modules."""
 
+    # Wordlist shared by every Scanner, reloaded only when the file changes on disk
+    _ADMIN_PATHS_CACHE: tuple[str, ...] | None = None
+    _ADMIN_PATHS_MTIME = 0.0
+
     def __init__(self, target_domain: str, progress_callback=None):
-        self.target_domain = self._safe_domain_from_input(target_domain)
+        self.target_domain = _normalize(target_domain)
         self.progress_callback = progress_callback
         self.results = {}
+        self._session = self._build_session()
+        self._homepage_cache: tuple[requests.Response, BeautifulSoup] | None = None
+        self._homepage_lock = threading.Lock()
 
     def _update_progress(self, module_name: str, status: str = "Completed"):
         """Updates the GUI via the provided callback."""
         if self.progress_callback:
             self.progress_callback(f"{module_name}: {status}")
 
-    def _safe_domain_from_input(self, target: str) -> str:
-        """Extracts a clean domain from user input (URL or domain)."""
-        if not target.startswith(('http://', 'https://')):
-            target = f"http://{target}"
-        parsed_uri = urlparse(target)
-        return parsed_uri.netloc
+    def _build_session(self) -> requests.Session:
+        """Creates a shared session so repeated requests reuse TCP/TLS connections."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=ADMIN_PROBE_WORKERS, pool_maxsize=ADMIN_PROBE_WORKERS)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     # --- UPDATED --- : run_full_scan now handles IP dependency for geolocation
     def run_full_scan(self):
@@ -58,25 +123,36 @@ class Scanner:
             "Admin Panel Finder": self._scan_admin_panels,
         }
 
-        for name, scan_func in scans.items():
-            try:
-                self._update_progress(name, "Scanning...")
-                self.results[name] = scan_func()
-                self._update_progress(name, "Done")
-            except Exception as e:
-                self.results[name] = {"error": str(e)}
-                self._update_progress(name, "Error")
+        with ThreadPoolExecutor(max_workers=len(scans)) as executor:
+            futures = [executor.submit(self._run_module, name, scan_func) for name, scan_func in scans.items()]
+            module_results = dict(future.result() for future in as_completed(futures))
+
+        # Keep the report order stable regardless of which module finished first
+        for name in scans:
+            self.results[name] = module_results[name]
         
         return self.results
 
+    def _run_module(self, name: str, scan_func) -> tuple[str, dict]:
+        """Runs a single scan module, reporting progress and trapping any error."""
+        try:
+            self._update_progress(name, "Scanning...")
+            result = scan_func()
+            self._update_progress(name, "Done")
+        except Exception as e:
+            result = {"error": str(e)}
+            self._update_progress(name, "Error")
+        return name, result
+
     def _resolve_ip(self) -> str | None:
         """Resolves the domain to an IP address."""
         try:
-            return socket.gethostbyname(self.target_domain)
+            return _resolve(self.target_domain)
         except socket.gaierror:
             return None
 
     # --- NEW --- : Added IP Geolocation function
+    @ttl_cached(_lookup_cache, ttl=LOOKUP_CACHE_TTL)
     def _scan_geolocation(self, ip_address: str | None) -> dict:
         """Gets physical location data from an IP address."""
         if not ip_address:
@@ -98,99 +174,163 @@ class Scanner:
     # --- NEW --- : Added robots.txt and sitemap.xml checker
     def _scan_robots_sitemap(self) -> dict:
         """Checks for the existence and content of robots.txt and sitemap.xml."""
-        results = {}
-        for file in ["robots.txt", "sitemap.xml"]:
-            try:
-                url = f"https://{self.target_domain}/{file}"
-                r = requests.get(url, timeout=5)
-                if r.status_code == 200:
-                    results[file] = r.text.strip()
-                else:
-                    results[file] = "Not found (Status: {r.status_code})"
-            except requests.RequestException:
-                results[file] = "Failed to retrieve."
-        return results
-
-    # --- UPDATED --- : Tech stack scan now uses the powerful 'builtwith' library
+        files = ["robots.txt", "sitemap.xml"]
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            return dict(zip(files, executor.map(self._fetch_site_file, files)))
+
+    def _fetch_site_file(self, file: str) -> str:
+        """Fetches a well-known file from the site root and summarises the outcome."""
+        try:
+            url = f"https://{self.target_domain}/{file}"
+            r = self._session.get(url, timeout=5)
+            if r.status_code == 200:
+                return r.text.strip()
+            return f"Not found (Status: {r.status_code})"
+        except requests.RequestException:
+            return "Failed to retrieve."
+
+    def _get_homepage(self) -> tuple[requests.Response, BeautifulSoup]:
+        """Fetches and parses the homepage once, sharing it between the modules that need it."""
+        with self._homepage_lock:
+            if self._homepage_cache is None:
+                r = self._session.get(f"https://{self.target_domain}", timeout=5)
+                # Raw bytes go straight to the parser, which sniffs the encoding itself;
+                # a charset from the Content-Type header is still honoured if present.
+                declared = r.encoding if "charset" in r.headers.get("Content-Type", "").lower() else None
+                self._homepage_cache = (r, BeautifulSoup(r.content, HTML_PARSER, from_encoding=declared))
+            return self._homepage_cache
+
+    # --- UPDATED --- : Tech stack reuses the shared homepage instead of letting builtwith refetch it
+    @ttl_cached(_tech_cache, ttl=TECH_CACHE_TTL)
     def _scan_tech_stack(self) -> dict:
         """Identifies technologies used on the website using the builtwith library."""
         if not builtwith:
             return {"error": "builtwith library not installed."}
         try:
-            # Prepend https:// as builtwith expects a full URL
-            url = f"https://{self.target_domain}"
-            tech_info = builtwith.parse(url)
+            r, soup = self._get_homepage()
+            html = r.content.decode(soup.original_encoding or "utf-8", errors="replace")
+            tech_info = builtwith.builtwith(f"https://{self.target_domain}", headers=r.headers, html=html)
             return tech_info if tech_info else {"info": "No specific technologies identified."}
         except Exception as e:
             return {"error": str(e)}
     
     # --- The rest of the functions are the same as before ---
     
+    @ttl_cached(_lookup_cache, ttl=LOOKUP_CACHE_TTL)
     def _scan_whois(self) -> dict:
         if not whois:
             return {"error": "python-whois library not installed."}
         w = whois.whois(self.target_domain)
-        clean_whois = {}
-        for key, value in w.items():
-            if isinstance(value, list):
-                clean_whois[key] = [str(v) for v in value]
-            else:
-                clean_whois[key] = str(value)
-        return clean_whois
+        return {
+            key: [str(v) for v in value] if isinstance(value, list) else str(value)
+            for key, value in w.items()
+        }
 
     def _scan_dns(self) -> dict:
         if not dnsresolver:
             return {"error": "dnspython library not installed."}
-        data = {}
         record_types = ["A", "AAAA", "MX", "NS", "TXT", "CNAME"]
-        for rtype in record_types:
-            try:
-                answers = dnsresolver.resolve(self.target_domain, rtype)
-                data[rtype] = [r.to_text() for r in answers]
-            except (dnsresolver.NoAnswer, dnsresolver.NXDOMAIN, dnsresolver.Timeout):
-                data[rtype] = ["N/A"]
+        resolver = dnsresolver.Resolver()
+        data = {}
+        with ThreadPoolExecutor(max_workers=len(record_types)) as executor:
+            futures = {rtype: executor.submit(resolver.resolve, self.target_domain, rtype, lifetime=3)
+                       for rtype in record_types}
+            for rtype, future in futures.items():
+                try:
+                    data[rtype] = [r.to_text() for r in future.result()]
+                except (dnsresolver.NoAnswer, dnsresolver.NXDOMAIN, dnsresolver.Timeout):
+                    data[rtype] = ["N/A"]
         return data
 
     def _scan_http_headers(self) -> dict:
         urls = [f"https://{self.target_domain}", f"http://{self.target_domain}"]
-        for url in urls:
-            try:
-                r = requests.head(url, timeout=5, allow_redirects=True)
+        executor = ThreadPoolExecutor(max_workers=len(urls))
+        futures = [executor.submit(self._session.head, url, timeout=5, allow_redirects=True) for url in urls]
+        try:
+            # Checked in order so HTTPS wins whenever both schemes respond
+            for future in futures:
+                try:
+                    r = future.result()
+                except requests.RequestException:
+                    continue
                 return {
                     "Final URL": r.url,
                     "Status Code": r.status_code,
                     "Headers": dict(r.headers),
                 }
-            except requests.RequestException:
-                continue
+        finally:
+            # Don't hold the scan up waiting on the HTTP fallback once HTTPS answered
+            executor.shutdown(wait=False)
         return {"error": "Could not connect to the server."}
 
     def _scan_admin_panels(self) -> dict:
-        paths_file = os.path.join("assets", "common_admin_paths.txt")
-        if not os.path.exists(paths_file):
-            return {"error": f"{paths_file} not found."}
-        with open(paths_file) as f:
-            common_paths = [line.strip() for line in f if line.strip()]
-        found = []
-        for path in common_paths:
-            url = f"https://{self.target_domain}/{path}"
-            try:
-                r = requests.get(url, timeout=3, allow_redirects=False)
-                if 200 <= r.status_code < 400:
-                    found.append(f"{url} (Status: {r.status_code})")
-            except requests.RequestException:
-                continue
+        common_paths = self._get_admin_paths()
+        if common_paths is None:
+            return {"error": f"{ADMIN_PATHS_FILE} not found."}
+        urls = [f"https://{self.target_domain}/{path}" for path in common_paths]
+        if httpx:
+            # Runs in this module's worker thread, which has no event loop of its own
+            statuses = asyncio.run(self._probe_statuses_async(urls))
+        else:
+            with ThreadPoolExecutor(max_workers=ADMIN_PROBE_WORKERS) as executor:
+                statuses = list(executor.map(self._probe_status, urls))
+        found = [f"{url} (Status: {status})" for url, status in zip(urls, statuses)
+                 if status is not None and 200 <= status < 400]
         return {"Found Panels": found if found else ["None"]}
 
+    @classmethod
+    def _get_admin_paths(cls) -> tuple[str, ...] | None:
+        """Returns the admin path wordlist, or None if the file is missing."""
+        try:
+            mtime = os.stat(ADMIN_PATHS_FILE).st_mtime
+        except OSError:
+            return None
+        if cls._ADMIN_PATHS_CACHE is None or mtime != cls._ADMIN_PATHS_MTIME:
+            with open(ADMIN_PATHS_FILE) as f:
+                cls._ADMIN_PATHS_CACHE = tuple(line.strip() for line in f if line.strip())
+            cls._ADMIN_PATHS_MTIME = mtime
+        return cls._ADMIN_PATHS_CACHE
+
+    def _probe_status(self, url: str) -> int | None:
+        """Returns the status code for a URL without reading its body."""
+        try:
+            r = self._session.head(url, timeout=3, allow_redirects=False)
+            if r.status_code == 405:
+                # Some servers reject HEAD; fall back to a GET but never read the body
+                r = self._session.get(url, timeout=3, allow_redirects=False, stream=True)
+                r.close()
+            return r.status_code
+        except requests.RequestException:
+            return None
+
+    async def _probe_statuses_async(self, urls: list[str]) -> list[int | None]:
+        """Probes every URL concurrently over one httpx client."""
+        limits = httpx.Limits(max_connections=ADMIN_PROBE_CONNECTIONS,
+                              max_keepalive_connections=ADMIN_PROBE_CONNECTIONS)
+        async with httpx.AsyncClient(http2=HTTP2_SUPPORTED, timeout=3, limits=limits) as client:
+            return await asyncio.gather(*(self._probe_status_async(client, url) for url in urls))
+
+    async def _probe_status_async(self, client, url: str) -> int | None:
+        """Async counterpart of _probe_status: HEAD first, GET only on 405."""
+        try:
+            r = await client.head(url)
+            if r.status_code != 405:
+                return r.status_code
+            async with client.stream("GET", url) as r:
+                return r.status_code
+        except httpx.HTTPError:
+            return None
+
     def _scan_html_meta(self) -> dict:
         try:
-            r = requests.get(f"https://{self.target_domain}", timeout=5)
-            soup = BeautifulSoup(r.text, "html.parser")
-            meta_info = {
-                tag.get("name", tag.get("property", "N/A")): tag.get("content", "N/A")
-                for tag in soup.find_all("meta")
-                if tag.get("content")
-            }
+            _, soup = self._get_homepage()
+            meta_info = {}
+            for tag in soup.find_all("meta"):
+                attrs = tag.attrs
+                content = attrs.get("content")
+                if not content:
+                    continue
+                meta_info[attrs.get("name") or attrs.get("property") or "N/A"] = content
             return meta_info if meta_info else {"info": "No meta tags found."}
         except requests.RequestException as e:
             return {"error": str(e)}